@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import re
+from functools import lru_cache
 
 #  https://developer.mozilla.org/en-US/docs/Web/JavaScript/Guide/Regular_expressions#escaping
 escaped_chars = {"$", "^", "+", ".", "*", "(", ")", "|", "\\", "?", "{", "}", "[", "]"}
 
 
+@lru_cache(maxsize=256)
 def glob_to_regex(glob: str) -> "re.Pattern[str]":
     tokens = ["^"]
     in_group = False
@@ -143,8 +143,7 @@ class URLMatcher:
         if isinstance(match, str):
             if base_url and not match.startswith("*"):
                 match = urljoin(base_url, match)
-            regex = glob_to_regex(match)
-            self._regex_obj = re.compile(regex)
+            self._regex_obj = glob_to_regex(match)
         elif isinstance(match, Pattern):
             self._regex_obj = match
         else:
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, cast
+from typing import Callable, Dict, Type
 
 from playwright._impl._artifact import Artifact
 from playwright._impl._browser import Browser
@@ -36,62 +36,48 @@ from playwright._impl._writable_stream import WritableStream
 
 
 class DummyObject(ChannelOwner):
-    def __init__(
-        self, parent: ChannelOwner, type: str, guid: str, initializer: Dict
-    ) -> None:
-        super().__init__(parent, type, guid, initializer)
+    pass
 
 
+_FACTORY: Dict[str, Type[ChannelOwner]] = {
+    "Artifact": Artifact,
+    "APIRequestContext": APIRequestContext,
+    "BindingCall": BindingCall,
+    "Browser": Browser,
+    "BrowserType": BrowserType,
+    "BrowserContext": BrowserContext,
+    "CDPSession": CDPSession,
+    "Dialog": Dialog,
+    "ElementHandle": ElementHandle,
+    "Frame": Frame,
+    "JSHandle": JSHandle,
+    "Page": Page,
+    "Playwright": Playwright,
+    "Request": Request,
+    "Response": Response,
+    "Route": Route,
+    "Stream": Stream,
+    "Tracing": Tracing,
+    "WebSocket": WebSocket,
+    "Worker": Worker,
+    "WritableStream": WritableStream,
+    "Selectors": SelectorsOwner,
+}
+
+
+# The trailing underscored parameters are bound at definition time so that the
+# hot path resolves them as locals instead of globals. Callers never pass them.
 def create_remote_object(
-    parent: ChannelOwner, type: str, guid: str, initializer: Dict
+    parent: ChannelOwner,
+    type: str,
+    guid: str,
+    initializer: Dict,
+    _get: Callable[[str, Type[ChannelOwner]], Type[ChannelOwner]] = _FACTORY.get,
+    _dummy: Type[ChannelOwner] = DummyObject,
 ) -> ChannelOwner:
-    if type == "Artifact":
-        return Artifact(parent, type, guid, initializer)
-    if type == "APIRequestContext":
-        return APIRequestContext(parent, type, guid, initializer)
-    if type == "BindingCall":
-        return BindingCall(parent, type, guid, initializer)
-    if type == "Browser":
-        return Browser(cast(BrowserType, parent), type, guid, initializer)
-    if type == "BrowserType":
-        return BrowserType(parent, type, guid, initializer)
-    if type == "BrowserContext":
-        return BrowserContext(parent, type, guid, initializer)
-    if type == "CDPSession":
-        return CDPSession(parent, type, guid, initializer)
-    if type == "Dialog":
-        return Dialog(parent, type, guid, initializer)
-    if type == "ElementHandle":
-        return ElementHandle(parent, type, guid, initializer)
-    if type == "Frame":
-        return Frame(parent, type, guid, initializer)
-    if type == "JSHandle":
-        return JSHandle(parent, type, guid, initializer)
     if type == "LocalUtils":
         local_utils = LocalUtils(parent, type, guid, initializer)
         if not local_utils._connection._local_utils:
             local_utils._connection._local_utils = local_utils
         return local_utils
-    if type == "Page":
-        return Page(parent, type, guid, initializer)
-    if type == "Playwright":
-        return Playwright(parent, type, guid, initializer)
-    if type == "Request":
-        return Request(parent, type, guid, initializer)
-    if type == "Response":
-        return Response(parent, type, guid, initializer)
-    if type == "Route":
-        return Route(parent, type, guid, initializer)
-    if type == "Stream":
-        return Stream(parent, type, guid, initializer)
-    if type == "Tracing":
-        return Tracing(parent, type, guid, initializer)
-    if type == "WebSocket":
-        return WebSocket(parent, type, guid, initializer)
-    if type == "Worker":
-        return Worker(parent, type, guid, initializer)
-    if type == "WritableStream":
-        return WritableStream(parent, type, guid, initializer)
-    if type == "Selectors":
-        return SelectorsOwner(parent, type, guid, initializer)
-    return DummyObject(parent, type, guid, initializer)
+    return _get(type, _dummy)(parent, type, guid, initializer)
@@ -18,6 +18,8 @@ from typing import Any, Callable, Coroutine, cast
 from playwright.async_api import BrowserContext, Page, Request, Route
 from tests.server import Server
 
+from .utils import passthrough
+
 
 async def test_should_work(page: Page, context: BrowserContext, server: Server) -> None:
     await context.route("**/*", lambda route: asyncio.create_task(route.fallback()))
@@ -29,24 +31,24 @@ async def test_should_fall_back(
 ) -> None:
     intercepted = []
 
-    def _handler1(route: Route) -> None:
+    async def _handler1(route: Route) -> None:
         intercepted.append(1)
-        asyncio.create_task(route.fallback())
+        await route.fallback()
 
     await context.route("**/empty.html", _handler1)
 
-    def _handler2(route: Route) -> None:
+    async def _handler2(route: Route) -> None:
         intercepted.append(2)
-        asyncio.create_task(route.fallback())
+        await route.fallback()
 
     await context.route(
         "**/empty.html",
         _handler2,
     )
 
-    def _handler3(route: Route) -> None:
+    async def _handler3(route: Route) -> None:
         intercepted.append(3)
-        asyncio.create_task(route.fallback())
+        await route.fallback()
 
     await context.route("**/empty.html", _handler3)
 
@@ -97,7 +99,7 @@ async def test_should_chain_once(
 async def test_should_fall_back_after_exception(
     page: Page, context: BrowserContext, server: Server
 ) -> None:
-    await context.route("**/empty.html", lambda route: route.continue_())
+    await context.route("**/empty.html", passthrough)
 
     async def handler(route: Route) -> None:
         try:
@@ -123,7 +125,9 @@ async def test_should_amend_http_headers(
     await context.route("**/sleep.zzz", handler)
 
     async def handler_with_header_mods(route: Route) -> None:
-        await route.fallback(headers={**route.request.headers, "FOO": "bar"})
+        headers = route.request.headers.copy()
+        headers["FOO"] = "bar"
+        await route.fallback(headers=headers)
 
     await context.route("**/*", handler_with_header_mods)
 
@@ -194,9 +198,9 @@ async def test_should_amend_method(
 
     method = []
 
-    def _handler1(route: Route) -> None:
+    async def _handler1(route: Route) -> None:
         method.append(route.request.method)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await context.route("**/*", _handler1)
     await context.route(
@@ -217,9 +221,9 @@ async def test_should_override_request_url(
 ) -> None:
     url = []
 
-    def _handler1(route: Route) -> None:
+    async def _handler1(route: Route) -> None:
         url.append(route.request.url)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await context.route(
         "**/global-var.html",
@@ -254,9 +258,9 @@ async def test_should_amend_post_data(
     await page.goto(server.EMPTY_PAGE)
     post_data = []
 
-    def _handler1(route: Route) -> None:
+    async def _handler1(route: Route) -> None:
         post_data.append(route.request.post_data)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await context.route("**/*", _handler1)
     await context.route(
@@ -276,9 +280,9 @@ async def test_should_amend_binary_post_data(
     await page.goto(server.EMPTY_PAGE)
     post_data_buffer = []
 
-    def _handler1(route: Route) -> None:
+    async def _handler1(route: Route) -> None:
         post_data_buffer.append(route.request.post_data)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await context.route("**/*", _handler1)
 
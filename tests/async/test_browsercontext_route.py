@@ -30,11 +30,13 @@ from playwright.async_api import (
 from tests.server import Server, TestServerRequest
 from tests.utils import must
 
+from .utils import passthrough
+
 
 async def test_route_should_intercept(context: BrowserContext, server: Server) -> None:
     intercepted = []
 
-    def handle(route: Route, request: Request) -> None:
+    async def handle(route: Route, request: Request) -> None:
         intercepted.append(True)
         assert "empty.html" in request.url
         assert request.headers["user-agent"]
@@ -44,7 +46,7 @@ async def test_route_should_intercept(context: BrowserContext, server: Server) -
         assert request.resource_type == "document"
         assert request.frame == page.main_frame
         assert request.frame.url == "about:blank"
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await context.route("**/empty.html", lambda route, request: handle(route, request))
     page = await context.new_page()
@@ -60,9 +62,9 @@ async def test_route_should_unroute(context: BrowserContext, server: Server) ->
 
     intercepted: List[int] = []
 
-    def handler(route: Route, request: Request, ordinal: int) -> None:
+    async def handler(route: Route, request: Request, ordinal: int) -> None:
         intercepted.append(ordinal)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await context.route("**/*", lambda route, request: handler(route, request, 1))
     await context.route(
@@ -72,8 +74,8 @@ async def test_route_should_unroute(context: BrowserContext, server: Server) ->
         "**/empty.html", lambda route, request: handler(route, request, 3)
     )
 
-    def handler4(route: Route, request: Request) -> None:
-        handler(route, request, 4)
+    async def handler4(route: Route, request: Request) -> None:
+        await handler(route, request, 4)
 
     await context.route(re.compile("empty.html"), handler4)
 
@@ -241,7 +243,7 @@ async def test_should_work_with_ignore_https_errors(
     context = await browser.new_context(ignore_https_errors=True)
     page = await context.new_page()
 
-    await page.route("**/*", lambda route: route.continue_())
+    await page.route("**/*", passthrough)
     response = await page.goto(https_server.EMPTY_PAGE)
     assert must(response).status == 200
     await context.close()
@@ -446,39 +448,39 @@ async def test_should_chain_fallback_into_page(
 ) -> None:
     intercepted = []
 
-    def _handler1(route: Route) -> None:
+    async def _handler1(route: Route) -> None:
         intercepted.append(1)
-        asyncio.create_task(route.fallback())
+        await route.fallback()
 
     await context.route("**/empty.html", _handler1)
 
-    def _handler2(route: Route) -> None:
+    async def _handler2(route: Route) -> None:
         intercepted.append(2)
-        asyncio.create_task(route.fallback())
+        await route.fallback()
 
     await context.route("**/empty.html", _handler2)
 
-    def _handler3(route: Route) -> None:
+    async def _handler3(route: Route) -> None:
         intercepted.append(3)
-        asyncio.create_task(route.fallback())
+        await route.fallback()
 
     await context.route("**/empty.html", _handler3)
 
-    def _handler4(route: Route) -> None:
+    async def _handler4(route: Route) -> None:
         intercepted.append(4)
-        asyncio.create_task(route.fallback())
+        await route.fallback()
 
     await page.route("**/empty.html", _handler4)
 
-    def _handler5(route: Route) -> None:
+    async def _handler5(route: Route) -> None:
         intercepted.append(5)
-        asyncio.create_task(route.fallback())
+        await route.fallback()
 
     await page.route("**/empty.html", _handler5)
 
-    def _handler6(route: Route) -> None:
+    async def _handler6(route: Route) -> None:
         intercepted.append(6)
-        asyncio.create_task(route.fallback())
+        await route.fallback()
 
     await page.route("**/empty.html", _handler6)
 
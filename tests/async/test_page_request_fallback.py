@@ -20,6 +20,8 @@ import pytest
 from playwright.async_api import Error, Page, Request, Route
 from tests.server import Server
 
+from .utils import passthrough
+
 
 async def test_should_work(page: Page, server: Server) -> None:
     await page.route("**/*", lambda route: asyncio.create_task(route.fallback()))
@@ -29,21 +31,21 @@ async def test_should_work(page: Page, server: Server) -> None:
 async def test_should_fall_back(page: Page, server: Server) -> None:
     intercepted = []
 
-    def _handler1(route: Route) -> None:
+    async def _handler1(route: Route) -> None:
         intercepted.append(1)
-        asyncio.create_task(route.fallback())
+        await route.fallback()
 
     await page.route("**/empty.html", _handler1)
 
-    def _handler2(route: Route) -> None:
+    async def _handler2(route: Route) -> None:
         intercepted.append(2)
-        asyncio.create_task(route.fallback())
+        await route.fallback()
 
     await page.route("**/empty.html", _handler2)
 
-    def _handler3(route: Route) -> None:
+    async def _handler3(route: Route) -> None:
         intercepted.append(3)
-        asyncio.create_task(route.fallback())
+        await route.fallback()
 
     await page.route("**/empty.html", _handler3)
 
@@ -135,7 +137,7 @@ async def test_should_not_chain_abort(
 
 
 async def test_should_fall_back_after_exception(page: Page, server: Server) -> None:
-    await page.route("**/empty.html", lambda route: route.continue_())
+    await page.route("**/empty.html", passthrough)
 
     async def handler(route: Route) -> None:
         try:
@@ -159,7 +161,9 @@ async def test_should_amend_http_headers(page: Page, server: Server) -> None:
     await page.route("**/sleep.zzz", handler)
 
     async def handler_with_header_mods(route: Route) -> None:
-        await route.fallback(headers={**route.request.headers, "FOO": "bar"})
+        headers = route.request.headers.copy()
+        headers["FOO"] = "bar"
+        await route.fallback(headers=headers)
 
     await page.route("**/*", handler_with_header_mods)
 
@@ -228,9 +232,9 @@ async def test_should_amend_method(page: Page, server: Server) -> None:
 
     method = []
 
-    def _handler(route: Route) -> None:
+    async def _handler(route: Route) -> None:
         method.append(route.request.method)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await page.route("**/*", _handler)
     await page.route(
@@ -249,9 +253,9 @@ async def test_should_amend_method(page: Page, server: Server) -> None:
 async def test_should_override_request_url(page: Page, server: Server) -> None:
     url = []
 
-    def _handler1(route: Route) -> None:
+    async def _handler1(route: Route) -> None:
         url.append(route.request.url)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await page.route("**/global-var.html", _handler1)
 
@@ -278,9 +282,9 @@ async def test_should_amend_post_data(page: Page, server: Server) -> None:
     await page.goto(server.EMPTY_PAGE)
     post_data = []
 
-    def _handler(route: Route) -> None:
+    async def _handler(route: Route) -> None:
         post_data.append(route.request.post_data)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await page.route("**/*", _handler)
     await page.route(
@@ -298,9 +302,9 @@ async def test_should_amend_binary_post_data(page: Page, server: Server) -> None
     await page.goto(server.EMPTY_PAGE)
     post_data_buffer = []
 
-    def _handler1(route: Route) -> None:
+    async def _handler1(route: Route) -> None:
         post_data_buffer.append(route.request.post_data)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await page.route("**/*", _handler1)
 
@@ -324,21 +328,21 @@ async def test_should_chain_fallback_with_dynamic_url(
 ) -> None:
     intercepted = []
 
-    def _handler1(route: Route) -> None:
+    async def _handler1(route: Route) -> None:
         intercepted.append(1)
-        asyncio.create_task(route.fallback(url=server.EMPTY_PAGE))
+        await route.fallback(url=server.EMPTY_PAGE)
 
     await page.route("**/bar", _handler1)
 
-    def _handler2(route: Route, request: Request) -> None:
+    async def _handler2(route: Route, request: Request) -> None:
         intercepted.append(2)
-        asyncio.create_task(route.fallback(url="http://localhost/bar"))
+        await route.fallback(url="http://localhost/bar")
 
     await page.route("**/foo", _handler2)
 
-    def _handler3(route: Route, request: Request) -> None:
+    async def _handler3(route: Route, request: Request) -> None:
         intercepted.append(3)
-        asyncio.create_task(route.fallback(url="http://localhost/foo"))
+        await route.fallback(url="http://localhost/foo")
 
     await page.route("**/empty.html", _handler3)
 
@@ -350,9 +354,9 @@ async def test_should_amend_json_post_data(server: Server, page: Page) -> None:
     await page.goto(server.EMPTY_PAGE)
     post_data = []
 
-    def _handle1(route: Route, request: Request) -> None:
+    async def _handle1(route: Route, request: Request) -> None:
         post_data.append(route.request.post_data)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await page.route("**/*", _handle1)
     await page.route(
@@ -33,6 +33,8 @@ from playwright.async_api import (
 from tests.server import Server, TestServerRequest
 from tests.utils import must
 
+from .utils import passthrough
+
 
 async def test_page_route_should_intercept(page: Page, server: Server) -> None:
     intercepted = []
@@ -61,30 +63,30 @@ async def test_page_route_should_intercept(page: Page, server: Server) -> None:
 async def test_page_route_should_unroute(page: Page, server: Server) -> None:
     intercepted = []
 
-    def _handle1(route: Route) -> None:
+    async def _handle1(route: Route) -> None:
         intercepted.append(1)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await page.route("**/*", _handle1)
 
-    def _handle2(route: Route, request: Request) -> None:
+    async def _handle2(route: Route, request: Request) -> None:
         intercepted.append(2)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await page.route("**/empty.html", _handle2)
 
-    def _handle3(route: Route, request: Request) -> None:
+    async def _handle3(route: Route, request: Request) -> None:
         intercepted.append(3)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await page.route(
         "**/empty.html",
         _handle3,
     )
 
-    def handler4(route: Route) -> None:
+    async def handler4(route: Route) -> None:
         intercepted.append(4)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await page.route(re.compile("empty.html"), handler4)
 
@@ -107,7 +109,7 @@ async def test_page_route_should_work_when_POST_is_redirected_with_302(
 ) -> None:
     server.set_redirect("/rredirect", "/empty.html")
     await page.goto(server.EMPTY_PAGE)
-    await page.route("**/*", lambda route: route.continue_())
+    await page.route("**/*", passthrough)
     await page.set_content(
         """
       <form action='/rredirect' method='post'>
@@ -124,10 +126,13 @@ async def test_page_route_should_work_when_header_manipulation_headers_with_redi
     page: Page, server: Server
 ) -> None:
     server.set_redirect("/rrredirect", "/empty.html")
-    await page.route(
-        "**/*",
-        lambda route: route.continue_(headers={**route.request.headers, "foo": "bar"}),
-    )
+
+    async def _handle(route: Route) -> None:
+        headers = route.request.headers.copy()
+        headers["foo"] = "bar"
+        await route.continue_(headers=headers)
+
+    await page.route("**/*", _handle)
 
     await page.goto(server.PREFIX + "/rrredirect")
 
@@ -158,9 +163,9 @@ async def test_page_route_should_contain_referer_header(
 ) -> None:
     requests = []
 
-    def _handle(route: Route, request: Request) -> None:
+    async def _handle(route: Route, request: Request) -> None:
         requests.append(route.request)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await page.route(
         "**/*",
@@ -182,7 +187,7 @@ async def test_page_route_should_properly_return_navigation_response_when_URL_ha
     )
 
     # Setup request interception.
-    await page.route("**/*", lambda route: route.continue_())
+    await page.route("**/*", passthrough)
     response = await page.reload()
     assert response
     assert response.status == 200
@@ -216,7 +221,7 @@ async def test_page_route_should_work_with_redirect_inside_sync_XHR(
 ) -> None:
     await page.goto(server.EMPTY_PAGE)
     server.set_redirect("/logo.png", "/pptr.png")
-    await page.route("**/*", lambda route: route.continue_())
+    await page.route("**/*", passthrough)
     status = await page.evaluate(
         """async() => {
       const request = new XMLHttpRequest();
@@ -292,7 +297,7 @@ async def test_page_route_should_be_abortable_with_custom_error_codes(
 async def test_page_route_should_send_referer(page: Page, server: Server) -> None:
     await page.set_extra_http_headers({"referer": "http://google.com/"})
 
-    await page.route("**/*", lambda route: route.continue_())
+    await page.route("**/*", passthrough)
     [request, _] = await asyncio.gather(
         server.wait_for_request("/grid.html"),
         page.goto(server.PREFIX + "/grid.html"),
@@ -320,9 +325,9 @@ async def test_page_route_should_not_work_with_redirects(
 ) -> None:
     intercepted = []
 
-    def _handle(route: Route, request: Request) -> None:
-        asyncio.create_task(route.continue_())
+    async def _handle(route: Route, request: Request) -> None:
         intercepted.append(route.request)
+        await route.continue_()
 
     await page.route(
         "**/*",
@@ -366,9 +371,9 @@ async def test_page_route_should_work_with_redirects_for_subresources(
 ) -> None:
     intercepted: List[Request] = []
 
-    def _handle(route: Route) -> None:
-        asyncio.create_task(route.continue_())
+    async def _handle(route: Route) -> None:
         intercepted.append(route.request)
+        await route.continue_()
 
     await page.route(
         "**/*",
@@ -448,9 +453,9 @@ async def test_page_route_should_navigate_to_dataURL_and_not_fire_dataURL_reques
 ) -> None:
     requests = []
 
-    def _handle(route: Route) -> None:
+    async def _handle(route: Route) -> None:
         requests.append(route.request)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await page.route(
         "**/*",
@@ -469,9 +474,9 @@ async def test_page_route_should_be_able_to_fetch_dataURL_and_not_fire_dataURL_r
     await page.goto(server.EMPTY_PAGE)
     requests = []
 
-    def _handle(route: Route) -> None:
+    async def _handle(route: Route) -> None:
         requests.append(route.request)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await page.route("**/*", _handle)
 
@@ -486,9 +491,9 @@ async def test_page_route_should_navigate_to_URL_with_hash_and_and_fire_requests
 ) -> None:
     requests = []
 
-    def _handle(route: Route) -> None:
+    async def _handle(route: Route) -> None:
         requests.append(route.request)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await page.route(
         "**/*",
@@ -508,7 +513,7 @@ async def test_page_route_should_work_with_encoded_server(
 ) -> None:
     # The requestWillBeSent will report encoded URL, whereas interception will
     # report URL as-is. @see crbug.com/759388
-    await page.route("**/*", lambda route: route.continue_())
+    await page.route("**/*", passthrough)
     response = await page.goto(server.PREFIX + "/some nonexisting page")
     assert response
     assert response.status == 404
@@ -521,9 +526,9 @@ async def test_page_route_should_work_with_encoded_server___2(
     # report encoded URL for stylesheet. @see crbug.com/759388
     requests: List[Request] = []
 
-    def _handle(route: Route) -> None:
-        asyncio.create_task(route.continue_())
+    async def _handle(route: Route) -> None:
         requests.append(route.request)
+        await route.continue_()
 
     await page.route("**/*", _handle)
 
@@ -559,9 +564,9 @@ async def test_page_route_should_intercept_main_resource_during_cross_process_na
     await page.goto(server.EMPTY_PAGE)
     intercepted = []
 
-    def _handle(route: Route) -> None:
+    async def _handle(route: Route) -> None:
         intercepted.append(True)
-        asyncio.create_task(route.continue_())
+        await route.continue_()
 
     await page.route(
         server.CROSS_PROCESS_PREFIX + "/empty.html",
@@ -1093,3 +1098,8 @@ async def test_glob_to_regex() -> None:
     assert glob_to_regex("$^+.\\*()|\\?\\{\\}\\[\\]") == re.compile(
         r"^\$\^\+\.\*\(\)\|\?\{\}\[\]$"
     )
+
+    glob_to_regex.cache_clear()
+    glob_to_regex("**/*.js")
+    glob_to_regex("**/*.js")
+    assert glob_to_regex.cache_info().hits == 1
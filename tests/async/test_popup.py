@@ -213,9 +213,11 @@ async def test_should_respect_routes_from_browser_context(
     page = await context.new_page()
     await page.goto(server.EMPTY_PAGE)
 
-    def handle_request(route: Route, request: Request, intercepted: List[bool]) -> None:
-        asyncio.create_task(route.continue_())
+    async def handle_request(
+        route: Route, request: Request, intercepted: List[bool]
+    ) -> None:
         intercepted.append(True)
+        await route.continue_()
 
     intercepted: List[bool] = []
     await context.route(
@@ -18,21 +18,23 @@ from typing import Optional
 from playwright.async_api import Page, Route
 from tests.server import Server
 
+from .utils import passthrough
+
 
 async def test_request_continue_should_work(page: Page, server: Server) -> None:
-    await page.route("**/*", lambda route: asyncio.create_task(route.continue_()))
+    await page.route("**/*", passthrough)
     await page.goto(server.EMPTY_PAGE)
 
 
 async def test_request_continue_should_amend_http_headers(
     page: Page, server: Server
 ) -> None:
-    await page.route(
-        "**/*",
-        lambda route: asyncio.create_task(
-            route.continue_(headers={**route.request.headers, "FOO": "bar"})
-        ),
-    )
+    async def _handle(route: Route) -> None:
+        headers = route.request.headers.copy()
+        headers["FOO"] = "bar"
+        await route.continue_(headers=headers)
+
+    await page.route("**/*", _handle)
 
     await page.goto(server.EMPTY_PAGE)
     [request, _] = await asyncio.gather(
@@ -20,6 +20,8 @@ from playwright.async_api import Browser, BrowserContext, BrowserType, Page
 from tests.server import Server
 from tests.utils import get_trace_actions, parse_trace
 
+from .utils import passthrough
+
 
 async def test_browser_context_output_trace(
     browser: Browser, server: Server, tmp_path: Path
@@ -96,9 +98,8 @@ async def test_should_collect_trace_with_resources_but_no_js(
     await page.mouse.dblclick(30, 30)
     await page.keyboard.insert_text("abc")
     await page.wait_for_timeout(2000)  # Give it some time to produce screenshots.
-    await page.route(
-        "**/empty.html", lambda route: route.continue_()
-    )  # should produce a route.continue_ entry.
+    # should produce a route.continue_ entry.
+    await page.route("**/empty.html", passthrough)
     await page.goto(server.EMPTY_PAGE)
     await page.goto(
         server.PREFIX + "/one-style.html"
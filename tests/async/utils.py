@@ -20,6 +20,7 @@ from playwright.async_api import (
     Error,
     Frame,
     Page,
+    Route,
     Selectors,
     ViewportSize,
 )
@@ -76,4 +77,8 @@ class Utils:
                 raise exc
 
 
+async def passthrough(route: Route) -> None:
+    await route.continue_()
+
+
 utils = Utils()
@@ -157,7 +157,9 @@ def test_should_amend_http_headers(page: Page, server: Server) -> None:
     page.route("**/sleep.zzz", handler)
 
     def handler_with_header_mods(route: Route) -> None:
-        route.fallback(headers={**route.request.headers, "FOO": "bar"})
+        headers = route.request.headers.copy()
+        headers["FOO"] = "bar"
+        route.fallback(headers=headers)
 
     page.route("**/*", handler_with_header_mods)
 